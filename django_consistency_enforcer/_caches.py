@@ -0,0 +1,14 @@
+from . import _functions, _raw_patterns, _scenarios
+
+
+def clear_caches() -> None:
+    """
+    Forget everything that has been remembered about callbacks, view classes
+    and converters.
+
+    What is found by inspecting these is cached for the life of the process, so
+    this should be called if any of them are changed after they have been seen.
+    """
+    _functions.Function.from_callback.cache_clear()
+    _raw_patterns._converter_annotation.cache_clear()
+    _scenarios._request_annotation.cache_clear()
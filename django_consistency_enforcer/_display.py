@@ -1,3 +1,5 @@
+import functools
+import sys
 import types
 from typing import Self
 
@@ -5,7 +7,7 @@ import attrs
 from django.urls import resolvers
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Where:
     """
     Used to say where an error with a url pattern can be found
@@ -16,13 +18,20 @@ class Where:
     module: str
     namespace: str
 
+    _displayed: dict[tuple[str, bool], str] = attrs.field(
+        init=False, factory=dict, eq=False, repr=False
+    )
+
     @classmethod
+    @functools.cache
     def empty(cls) -> Self:
         """
-        Used to construct an instance where all the values are empty.
+        Used to get an instance where all the values are empty.
 
         Useful in tests especially to create an instance of this class where we
         don't need to worry about the details it's actually representing.
+
+        The same instance is returned every time this is called.
         """
         return cls(name="", regex="", module="", namespace="")
 
@@ -39,15 +48,18 @@ class Where:
         Used to construct an instance taking into account the type of the
         urlconf_module on a url resolver.
         """
+        module = ""
         if isinstance(resolver.urlconf_module, types.ModuleType):
-            return cls(
-                module=resolver.urlconf_module.__file__ or "",
-                name=name or "",
-                namespace=namespace or "",
-                regex=regex,
-            )
-        else:
-            return cls(module="", name=name or "", namespace=namespace or "", regex=regex)
+            module = resolver.urlconf_module.__file__ or ""
+
+        # The same modules, namespaces and patterns are seen many times when
+        # walking a url tree, so share a single copy of each string
+        return cls(
+            module=sys.intern(module),
+            name=sys.intern(name or ""),
+            namespace=sys.intern(namespace or ""),
+            regex=sys.intern(regex),
+        )
 
     def display(self, *, indent: str = "  ", display_regex: bool = True) -> str:
         """
@@ -56,6 +68,15 @@ class Where:
         Essentially a string with each property on it's own line indented the
         amount as specified.
         """
+        key = (indent, display_regex)
+        displayed = self._displayed.get(key)
+        if displayed is None:
+            displayed = self._displayed[key] = self._display(
+                indent=indent, display_regex=display_regex
+            )
+        return displayed
+
+    def _display(self, *, indent: str, display_regex: bool) -> str:
         parts: list[str] = []
         if self.module:
             parts.append(f"{indent}module = {self.module}")
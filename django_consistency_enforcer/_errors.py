@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import abc
+import functools
 import typing
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Protocol, Self
 
 import attrs
@@ -14,8 +15,44 @@ class _Display(Protocol):
     def __call__(self, *, indent: str = ...) -> str: ...
 
 
+_ORDINALS = ("first", "second")
+
+
+def _sorted_tuple(names: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sorted(names))
+
+
 class InvalidPattern(Exception):
-    pass
+    """
+    The base class for errors found with url patterns.
+
+    Subclasses should implement `build_str` rather than `__str__` so that
+    the stringified form is only created once per instance.
+    """
+
+    @functools.cached_property
+    def _str(self) -> str:
+        return self.build_str()
+
+    def build_str(self) -> str:
+        """
+        Return the stringified representation of this error.
+        """
+        return super().__str__()
+
+    def __str__(self) -> str:
+        return self._str
+
+
+@attrs.define
+class _RepeatedError:
+    """
+    An error held by the :class:`ErrorContainer` and how many times an error
+    with the same stringified representation has been added.
+    """
+
+    error: InvalidPattern
+    count: int = 1
 
 
 @attrs.frozen
@@ -25,21 +62,24 @@ class ErrorContainer:
     read only interface for accessing them.
     """
 
-    _by_error_str: dict[str, int] = attrs.field(init=False, factory=dict)
-    _error_by_str: dict[str, InvalidPattern] = attrs.field(init=False, factory=dict)
+    _by_error_str: dict[str, _RepeatedError] = attrs.field(init=False, factory=dict)
+    _most_repeated: tuple[str, ...] | None = attrs.field(
+        init=False, default=None, eq=False, repr=False
+    )
 
     def add(self, error: InvalidPattern) -> None:
         """
         Add an error to the container.
         """
-        error_str = str(error)
-        if error_str not in self._error_by_str:
-            self._error_by_str[error_str] = error
-
-        if error_str not in self._by_error_str:
-            self._by_error_str[error_str] = 0
+        # Forget the ordering we had for by_most_repeated
+        object.__setattr__(self, "_most_repeated", None)
 
-        self._by_error_str[error_str] += 1
+        error_str = str(error)
+        repeated = self._by_error_str.get(error_str)
+        if repeated is None:
+            self._by_error_str[error_str] = _RepeatedError(error=error)
+        else:
+            repeated.count += 1
 
     def __iter__(self) -> Iterator[InvalidPattern]:
         """
@@ -47,7 +87,13 @@ class ErrorContainer:
 
         Will de-duplicate errors by their stringified representation.
         """
-        yield from (self._error_by_str[error_str] for error_str in self._by_error_str)
+        yield from (repeated.error for repeated in self._by_error_str.values())
+
+    def __len__(self) -> int:
+        """
+        The number of distinct errors currently held by the container
+        """
+        return len(self._by_error_str)
 
     @property
     def errors(self) -> Iterator[InvalidPattern]:
@@ -63,16 +109,22 @@ class ErrorContainer:
         Return an iterator of the stringified representation of the errors held
         by the container ordered such that the most repeated errors comes before
         less repeated errors.
+
+        The order is remembered until another error is added.
         """
-        yield from (
-            error
-            for error, _ in (
+        most_repeated = self._most_repeated
+        if most_repeated is None:
+            # sorted is stable, so errors repeated the same number of times stay in
+            # the order they were first added
+            most_repeated = tuple(
                 sorted(
-                    self._by_error_str.items(),
-                    key=lambda pair: (-pair[1], pair[0].__class__.__name__),
+                    self._by_error_str,
+                    key=lambda error_str: -self._by_error_str[error_str].count,
                 )
             )
-        )
+            object.__setattr__(self, "_most_repeated", most_repeated)
+
+        yield from most_repeated
 
 
 @attrs.frozen
@@ -97,7 +149,7 @@ class NoPositionalArguments(InvalidPattern):
     pattern: _raw_patterns.RawPattern
     where: _display.Where
 
-    def __str__(self) -> str:
+    def build_str(self) -> str:
         return f"[NoPositionalArguments]\n{self.where.display()}\n  :: Please ensure that captured groups in url patterns always have a name"
 
 
@@ -111,7 +163,7 @@ class MustSubclassDjangoGenericView(InvalidPattern):
     pattern: _raw_patterns.RawPattern
     where: _display.Where
 
-    def __str__(self) -> str:
+    def build_str(self) -> str:
         return f"[MustSubclassDjangoGenericView]\n{self.where.display(display_regex=False)}\n  :: Views must inherit from django.views.generic.View"
 
 
@@ -124,25 +176,27 @@ class RequiredArgOnViewNotAlwaysRequiredByPattern(InvalidPattern):
 
     pattern_wheres: Sequence[_display.Where]
     function_where: _Display
-    missing_args: set[str]
-
-    def __str__(self) -> str:
-        url_patterns = ["  url patterns >>"]
+    missing_args: tuple[str, ...] = attrs.field(converter=_sorted_tuple)
+
+    def build_str(self) -> str:
+        lines = [
+            "[RequiredArgOnViewNotAlwaysRequiredByPattern]",
+            f"  {self.function_where()}",
+            f"  missing_from_urlpatterns = {list(self.missing_args)}",
+            "  url patterns >>",
+        ]
         for i, where in enumerate(self.pattern_wheres):
-            url_patterns.append(f"    {i} >")
-            url_patterns.extend(where.display(indent="      ").split("\n"))
+            lines.append(f"    {i} >")
+            lines.append(where.display(indent="      "))
 
-        return "\n".join(
+        lines.extend(
             [
-                "[RequiredArgOnViewNotAlwaysRequiredByPattern]",
-                f"  {self.function_where()}",
-                f"  missing_from_urlpatterns = {sorted(self.missing_args)}",
-                "\n".join(url_patterns),
                 " :: Found arguments on the view that are not provided by any of the patterns that lead to that view",
                 " :: You likely want to use Unpack on the kwargs with a NotRequired on these args",
                 " :: Or give them default values if you have provided explicit keywords to the function",
             ]
         )
+        return "\n".join(lines)
 
 
 @attrs.frozen(kw_only=True)
@@ -156,21 +210,24 @@ class ViewDoesNotAcceptCapturedArg(InvalidPattern):
     missing: Sequence[tuple[_display.Where, str]]
     function_where: _Display
 
-    def __str__(self) -> str:
-        missing: list[str] = []
+    def build_str(self) -> str:
+        # The originating location is the part of the pattern with the last missing arg
+        originating, _ = self.missing[-1]
+        lines = [
+            "[ViewDoesNotAcceptCapturedArg]",
+            f"  Originating:\n{originating.display(indent='    ')}",
+            f"  {self.function_where()}",
+        ]
         for where, name in self.missing:
-            missing.append(f"  Missing captured arg: {name}\n{where.display(indent='    ')}")
+            lines.append(f"  Missing captured arg: {name}\n{where.display(indent='    ')}")
 
-        return "\n".join(
+        lines.extend(
             [
-                "[ViewDoesNotAcceptCapturedArg]",
-                f"  Originating:\n{where.display(indent='    ')}",
-                f"  {self.function_where()}",
-                "\n".join(missing),
                 " :: There are args in the pattern that the view is not aware of",
                 " :: You likely want to add those extra arguments to the view!",
             ]
         )
+        return "\n".join(lines)
 
 
 @attrs.frozen(kw_only=True)
@@ -190,7 +247,7 @@ class InvalidRequestAnnotation(InvalidPattern, abc.ABC):
     acceptable_annotations: Sequence[object]
     acceptable_request_annotation_containers: Sequence[object]
 
-    @property
+    @functools.cached_property
     def error(self) -> str:
         """
         Create a specific error condition depending on what is wrong.
@@ -228,7 +285,7 @@ class InvalidRequestAnnotation(InvalidPattern, abc.ABC):
         create a valid annotation for the request attribute on the view.
         """
 
-    def __str__(self) -> str:
+    def build_str(self) -> str:
         return "\n".join(
             [
                 "[InvalidRequestAnnotation]",
@@ -277,10 +334,8 @@ class MismatchedRequiredArgs(InvalidPattern):
             Create an instance explaining that a positional argument is expected
             to have some specific different name.
             """
-            if index == 0:
-                reason = f"The first argument should be named {want}, but got {got}"
-            elif index == 1:
-                reason = f"The second argument should be named {want}, but got {got}"
+            if index < len(_ORDINALS):
+                reason = f"The {_ORDINALS[index]} argument should be named {want}, but got {got}"
             else:
                 reason = f"Require positional parameter {index} to be named {want}, but got {got}"
             return cls(reason=reason)
@@ -319,7 +374,7 @@ class MismatchedRequiredArgs(InvalidPattern):
     function: _functions.DispatchFunction
     incorrect: Sequence[Incorrect]
 
-    def __str__(self) -> str:
+    def build_str(self) -> str:
         problems = "\n    * ".join(inc.reason for inc in self.incorrect)
         add_auth_message = any(inc.add_auth_message for inc in self.incorrect)
         msg = (
@@ -341,26 +396,27 @@ class InvalidArgAnnotations(InvalidPattern):
 
     function_where: _Display
     where: _display.Where
-    incorrect: list[tuple[str, object, object]]
-
-    def __str__(self) -> str:
-        incorrect = []
+    incorrect: Sequence[tuple[str, object, object]]
+
+    def build_str(self) -> str:
+        lines = [
+            "[InvalidArgAnnotations]",
+            f"  Originating:\n{self.where.display(indent='    ')}",
+            f"  {self.function_where()}",
+            "  Found some args that have incorrect annotations:",
+        ]
         for name, view_annotation, pattern_annotation in self.incorrect:
-            incorrect.append(
+            lines.append(
                 f"    * Expected '{name}' to be '{pattern_annotation}', found '{view_annotation}'"
             )
 
-        return "\n".join(
+        lines.extend(
             [
-                "[InvalidArgAnnotations]",
-                f"  Originating:\n{self.where.display(indent='    ')}",
-                f"  {self.function_where()}",
-                "  Found some args that have incorrect annotations:",
-                "\n".join(incorrect),
                 "  :: When we defined url patterns we end up using converters that can change what",
                 "  :: type the view gets and we want to mirror this in our dispatch related signatures",
             ]
         )
+        return "\n".join(lines)
 
 
 @attrs.frozen
@@ -374,13 +430,15 @@ class KwargsMustBeAnnotated(InvalidPattern):
     allows_object: bool
     allows_any: bool
 
-    def __str__(self) -> str:
-        msg = [
-            f"Please ensure `**{self.arg_name}` has an annotation using typing.Unpack or specify keyword arguments explicitly"
+    def build_str(self) -> str:
+        lines = [
+            "[KwargsMustBeAnnotated]",
+            f"  {self.function.display()}",
+            f"  :: Please ensure `**{self.arg_name}` has an annotation using typing.Unpack or specify keyword arguments explicitly",
         ]
         if self.allows_object:
-            msg.append(f"or use `**{self.arg_name}: object`")
+            lines.append(f"  :: or use `**{self.arg_name}: object`")
         if self.allows_any:
-            msg.append(f"or use `**{self.arg_name}: Any` from the typing module")
+            lines.append(f"  :: or use `**{self.arg_name}: Any` from the typing module")
 
-        return f"[KwargsMustBeAnnotated]\n  {self.function.display()}\n  :: " + "\n  :: ".join(msg)
+        return "\n".join(lines)
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import types
 import typing
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any, ForwardRef, NotRequired, Required, Self, TypedDict, Unpack
 
 import attrs
 from typing_extensions import get_annotations
 
+_UNION_ORIGINS = (types.UnionType, typing.Union)
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+_KEYWORD_ONLY_KINDS = (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+def _union_members(annotation: object) -> tuple[object, ...]:
+    """
+    Return the members of the annotation if it's a union, otherwise the annotation itself.
+    """
+    if typing.get_origin(annotation) in _UNION_ORIGINS:
+        return typing.get_args(annotation)
+    else:
+        return (annotation,)
+
 
 @attrs.frozen
 class FunctionArg:
@@ -37,6 +53,12 @@ class FunctionArg:
     is_variable_positional: bool = False
     """Whether this argument is a `*args`"""
 
+    _accepts: tuple[object, ...] = attrs.field(init=False, eq=False, repr=False)
+
+    @_accepts.default
+    def _default_accepts(self) -> tuple[object, ...]:
+        return _union_members(self.annotation)
+
     def matches(self, annotation: object) -> bool:
         """
         Returns whether the annotation on the argument matches some specific annotation.
@@ -50,19 +72,12 @@ class FunctionArg:
         if self.annotation == Any or (self.is_variable_keywords and self.annotation == object):
             return True
 
-        accepts: list[object] = []
-        if typing.get_origin(self.annotation) in (types.UnionType, typing.Union):
-            accepts.extend(typing.get_args(self.annotation))
-        else:
-            accepts.append(self.annotation)
+        accepts = self._accepts
+        return all(req in accepts for req in _union_members(annotation))
 
-        requires: list[object] = []
-        if typing.get_origin(annotation) in (types.UnionType, typing.Union):
-            requires.extend(typing.get_args(annotation))
-        else:
-            requires.append(annotation)
 
-        return all(req in accepts for req in requires)
+def _function_args_tuple(function_args: Iterable[FunctionArg]) -> tuple[FunctionArg, ...]:
+    return tuple(function_args)
 
 
 @attrs.frozen
@@ -77,7 +92,7 @@ class Function:
     module: str
     """The import path to the module the function is defined in"""
 
-    function_args: Sequence[FunctionArg]
+    function_args: tuple[FunctionArg, ...] = attrs.field(converter=_function_args_tuple)
     """The arguments to this function"""
 
     allows_arbitrary: bool
@@ -93,7 +108,58 @@ class Function:
     (may be different to view_class if defined on a parent)
     """
 
+    args_by_name: Mapping[str, FunctionArg] = attrs.field(init=False, eq=False, repr=False)
+    """The arguments to this function by their name"""
+
+    @args_by_name.default
+    def _default_args_by_name(self) -> Mapping[str, FunctionArg]:
+        return {function_arg.name: function_arg for function_arg in self.function_args}
+
+    _keyword_names: dict[int, tuple[frozenset[str], frozenset[str]]] = attrs.field(
+        init=False, factory=dict, eq=False, repr=False
+    )
+
+    def keyword_names(self, *, skip_positional: int) -> frozenset[str]:
+        """
+        Return the names of the arguments that may be passed in by keyword once
+        `self` and the first `skip_positional` arguments have been used up.
+        """
+        return self._find_keyword_names(skip_positional)[0]
+
+    def required_keyword_names(self, *, skip_positional: int) -> frozenset[str]:
+        """
+        Return the names of the required arguments that are left once `self`
+        and the first `skip_positional` arguments have been used up.
+        """
+        return self._find_keyword_names(skip_positional)[1]
+
+    def _find_keyword_names(self, skip_positional: int) -> tuple[frozenset[str], frozenset[str]]:
+        if (found := self._keyword_names.get(skip_positional)) is not None:
+            return found
+
+        available: set[str] = set()
+        required: set[str] = set()
+        remaining = skip_positional
+        for arg in self.function_args:
+            if arg.is_self:
+                continue
+
+            if remaining:
+                remaining -= 1
+                continue
+
+            if arg.is_variable_keywords or arg.is_variable_positional:
+                continue
+
+            available.add(arg.name)
+            if arg.required:
+                required.add(arg.name)
+
+        found = self._keyword_names[skip_positional] = (frozenset(available), frozenset(required))
+        return found
+
     @classmethod
+    @functools.cache
     def from_callback(
         cls,
         callback: Callable[..., object],
@@ -108,6 +174,10 @@ class Function:
 
         Will also find any `**kwargs: Unpack[...]` and treat those as if they
         were defined as individual keyword arguments.
+
+        Results are cached for the life of the process, which keeps the callback
+        and view class alive. Use :func:`django_consistency_enforcer.urls.clear_caches`
+        if either is changed after it has been seen.
         """
         callback_module = inspect.getmodule(callback)
 
@@ -118,26 +188,28 @@ class Function:
 
         defined_on: type | None = None
         if view_class is not None:
-            for kls in reversed(inspect.getmro(view_class)):
-                if callback.__name__ in kls.__dict__:
-                    defined_on = kls
+            # The most derived class that defines the method is the one python uses
+            name = callback.__name__
+            defined_on = next((kls for kls in view_class.__mro__ if name in kls.__dict__), None)
 
         if defined_on is not None:
             localns = defined_on.__dict__
 
         signature = inspect.signature(callback)
-        annotations = typing.get_type_hints(callback, globalns=globalns, localns=localns)
-        if not annotations and getattr(callback, "__no_type_check__", False):
-            annotations = get_annotations(callback, eval_str=True)
+
+        annotations: dict[str, Any] = {}
+        # Avoid resolving type hints when there are no annotations to resolve
+        if getattr(callback, "__annotations__", None) != {}:
+            annotations = typing.get_type_hints(callback, globalns=globalns, localns=localns)
+            if not annotations and getattr(callback, "__no_type_check__", False):
+                annotations = get_annotations(callback, eval_str=True)
 
         function_args: list[FunctionArg] = []
         allows_arbitary = False
         for i, param in enumerate(signature.parameters.values()):
+            kind = param.kind
             if view_class is not None and i == 0:
-                assert param.kind in (
-                    inspect.Parameter.POSITIONAL_ONLY,
-                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                )
+                assert kind in _POSITIONAL_KINDS
                 function_args.append(
                     FunctionArg(
                         name=param.name,
@@ -151,7 +223,7 @@ class Function:
                 )
                 continue
 
-            if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            if kind is inspect.Parameter.VAR_POSITIONAL:
                 function_args.append(
                     FunctionArg(
                         name=param.name,
@@ -165,7 +237,8 @@ class Function:
                 )
                 continue
 
-            if param.kind == inspect.Parameter.VAR_KEYWORD and (
+            is_variable_keywords = kind is inspect.Parameter.VAR_KEYWORD
+            if is_variable_keywords and (
                 param.annotation is param.empty or annotations[param.name] in (object, Any)
             ):
                 allows_arbitary = True
@@ -197,20 +270,11 @@ class Function:
                 function_args.append(
                     FunctionArg(
                         name=param.name,
-                        required=(
-                            param.default == param.empty
-                            and param.kind
-                            not in (
-                                inspect.Parameter.VAR_POSITIONAL,
-                                inspect.Parameter.VAR_KEYWORD,
-                            )
-                        ),
-                        keyword_only=(
-                            param.kind
-                            in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
-                        ),
+                        # *args has already been handled above
+                        required=param.default is param.empty and not is_variable_keywords,
+                        keyword_only=kind in _KEYWORD_ONLY_KINDS,
                         annotation=annotation,
-                        is_variable_keywords=param.kind == inspect.Parameter.VAR_KEYWORD,
+                        is_variable_keywords=is_variable_keywords,
                     )
                 )
 
@@ -269,6 +333,11 @@ class DispatchFunction:
         """Proxy `function_args` from the function"""
         return self._function.function_args
 
+    @property
+    def args_by_name(self) -> Mapping[str, FunctionArg]:
+        """Proxy `args_by_name` from the function"""
+        return self._function.args_by_name
+
     @property
     def allows_arbitrary(self) -> bool:
         """Proxy `allows_arbitrary` from the function"""
@@ -284,6 +353,22 @@ class DispatchFunction:
         """Proxy `defined_on` from the function"""
         return self._function.defined_on
 
+    @property
+    def keyword_names(self) -> frozenset[str]:
+        """
+        The names of the arguments that may be passed in by keyword after the
+        positional arguments
+        """
+        return self._function.keyword_names(skip_positional=len(self.positional))
+
+    @property
+    def required_keyword_names(self) -> frozenset[str]:
+        """
+        The names of the required arguments that come after the positional
+        arguments
+        """
+        return self._function.required_keyword_names(skip_positional=len(self.positional))
+
     class _DisplayArgs(TypedDict):
         indent: NotRequired[str]
 
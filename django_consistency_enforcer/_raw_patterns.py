@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import typing
 import uuid
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence, Set
 from typing import Protocol, Self
 
 import attrs
@@ -12,6 +13,36 @@ from . import _display
 
 type _PatternType = resolvers.RegexPattern | resolvers.RoutePattern
 
+# The annotations for the objects returned by the converters that come with Django
+_BUILTIN_CONVERTER_ANNOTATIONS: dict[type, object] = {
+    converters.StringConverter: str,
+    converters.SlugConverter: str,
+    converters.PathConverter: str,
+    converters.IntConverter: int,
+    converters.UUIDConverter: uuid.UUID,
+}
+
+
+@functools.cache
+def _converter_annotation(converter_type: type) -> object | None:
+    """
+    Return the annotation for what converters of this type return from `to_python`.
+    """
+    annotation = _BUILTIN_CONVERTER_ANNOTATIONS.get(converter_type)
+    if annotation is not None:
+        return annotation
+
+    # Subclasses of the builtin converters return the same type of object
+    for kls, annotation in _BUILTIN_CONVERTER_ANNOTATIONS.items():
+        if issubclass(converter_type, kls):
+            return annotation
+
+    to_python = getattr(converter_type, "to_python", None)
+    if to_python is None:
+        return None
+
+    return typing.get_type_hints(to_python).get("return")
+
 
 @attrs.frozen
 class CapturedArg:
@@ -43,24 +74,18 @@ class CapturedArg:
         if converter is None:
             return cls(converter=None, annotation=str)
 
-        if isinstance(converter, converters.StringConverter):
-            return cls(converter=converter, annotation=str)
-        elif isinstance(converter, converters.IntConverter):
-            return cls(converter=converter, annotation=int)
-        elif isinstance(converter, converters.UUIDConverter):
-            return cls(converter=converter, annotation=uuid.UUID)
-        else:
-            to_python = getattr(converter, "to_python", None)
-            if to_python is not None:
-                ret = typing.get_type_hints(to_python).get("return")
-                if ret is not None:
-                    return cls(converter=converter, annotation=ret)
+        annotation = _converter_annotation(type(converter))
+        if annotation is not None:
+            return cls(converter=converter, annotation=annotation)
 
         raise AssertionError(
             f"Need to expand the test to understand different kind of converter: {converter}"
         )
 
 
+_NO_DEFAULT_ARGS: frozenset[str] = frozenset()
+
+
 class CapturedArgMaker(Protocol):
     """
     Represents a constructor that returns a :class:`CapturedArg` object.
@@ -84,9 +109,16 @@ class RawPatternPart:
     where: _display.Where
     """Holds onto information about where this pattern is defined"""
 
-    default_arg_names: set[str] = attrs.field(factory=set)
+    default_arg_names: Set[str] = attrs.field(factory=frozenset)
     """Holds onto the names of any arguments that are provided to the view regardless of the url"""
 
+    captured_and_defaults: tuple[str, ...] = attrs.field(init=False, eq=False, repr=False)
+    """The names of the captured args followed by the names of the default args"""
+
+    @captured_and_defaults.default
+    def _default_captured_and_defaults(self) -> tuple[str, ...]:
+        return (*self.captured, *self.default_arg_names)
+
     @classmethod
     def from_pattern(
         cls,
@@ -109,7 +141,7 @@ class RawPatternPart:
         return cls(
             groups=regex.groups,
             captured=captured,
-            default_arg_names=set(default_args),
+            default_arg_names=frozenset(default_args) if default_args else _NO_DEFAULT_ARGS,
             where=where,
         )
 
@@ -160,7 +192,6 @@ def all_django_patterns(
     resolver: resolvers.URLResolver,
     *,
     captured_arg_maker: CapturedArgMaker = CapturedArg.from_converter,
-    _chain: list[tuple[_PatternType, dict[str, object], _display.Where]] | None = None,
 ) -> Iterator[RawPattern]:
     """
     This is used to get us every url pattern matched to the callback associated with that url
@@ -168,39 +199,59 @@ def all_django_patterns(
     We can use this to then check that the url patterns and the signatures of the functions on the
     view match up
     """
-    if _chain is None:
-        _chain = []
-
-    assert isinstance(resolver.pattern, resolvers.RegexPattern | resolvers.RoutePattern)
-
-    resolver_where = _display.Where.from_resolver(
-        resolver,
-        namespace=resolver.namespace,
-        regex=resolver.pattern.regex.pattern,
-    )
-    for pattern in resolver.url_patterns:
-        if not isinstance(pattern, resolvers.URLResolver):
-            assert isinstance(pattern.pattern, resolvers.RegexPattern | resolvers.RoutePattern)
-            pattern_where = _display.Where.from_resolver(
-                resolver, name=pattern.name, regex=pattern.pattern.regex.pattern
-            )
-            yield RawPattern.from_parts(
-                [
-                    RawPatternPart.from_pattern(
-                        patt, default_args, where=where, captured_arg_maker=captured_arg_maker
-                    )
-                    for patt, default_args, where in (
-                        *_chain,
-                        (resolver.pattern, resolver.default_kwargs, resolver_where),
-                        (pattern.pattern, pattern.default_args, pattern_where),
-                    )
-                ],
-                callback=pattern.callback,
-                where=pattern_where,
-            )
-        else:
-            yield from all_django_patterns(
-                pattern,
-                captured_arg_maker=captured_arg_maker,
-                _chain=[*_chain, (resolver.pattern, resolver.default_kwargs, resolver_where)],
-            )
+    # Nested resolvers are walked with an explicit stack rather than recursion so that
+    # deeply nested includes don't need a generator per level. Each entry holds the
+    # parts for the resolvers that lead to it and an iterator of the url patterns left
+    # to visit. The part for each resolver is made once and shared by every pattern under it
+    stack: list[
+        tuple[
+            resolvers.URLResolver,
+            list[RawPatternPart],
+            Iterator[resolvers.URLPattern | resolvers.URLResolver],
+        ]
+    ] = []
+
+    def push(resolver: resolvers.URLResolver, chain: list[RawPatternPart]) -> None:
+        resolver_pattern = resolver.pattern
+        assert isinstance(resolver_pattern, resolvers.RegexPattern | resolvers.RoutePattern)
+
+        resolver_where = _display.Where.from_resolver(
+            resolver,
+            namespace=resolver.namespace,
+            regex=resolver_pattern.regex.pattern,
+        )
+        resolver_part = RawPatternPart.from_pattern(
+            resolver_pattern,
+            resolver.default_kwargs,
+            where=resolver_where,
+            captured_arg_maker=captured_arg_maker,
+        )
+        stack.append((resolver, [*chain, resolver_part], iter(resolver.url_patterns)))
+
+    push(resolver, [])
+
+    while stack:
+        resolver, chain, remaining = stack[-1]
+        pattern = next(remaining, None)
+        if pattern is None:
+            stack.pop()
+            continue
+
+        if isinstance(pattern, resolvers.URLResolver):
+            push(pattern, chain)
+            continue
+
+        leaf_pattern = pattern.pattern
+        assert isinstance(leaf_pattern, resolvers.RegexPattern | resolvers.RoutePattern)
+        pattern_where = _display.Where.from_resolver(
+            resolver, name=pattern.name, regex=leaf_pattern.regex.pattern
+        )
+        leaf_part = RawPatternPart.from_pattern(
+            leaf_pattern,
+            pattern.default_args,
+            where=pattern_where,
+            captured_arg_maker=captured_arg_maker,
+        )
+        yield RawPattern.from_parts(
+            [*chain, leaf_part], callback=pattern.callback, where=pattern_where
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import typing
 from collections.abc import Sequence
 from typing import Any, Generic
@@ -10,6 +11,36 @@ import attrs
 from . import _display, _errors, _functions, _view_patterns
 
 
+def _frozenset_if_hashable(items: Sequence[object]) -> frozenset[object] | None:
+    """
+    Return the items as a frozenset, or None if any of them can't be hashed.
+    """
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
+
+
+def _is_one_of(item: object, as_set: frozenset[object] | None, items: Sequence[object]) -> bool:
+    """
+    Return whether the item is one of the items, using the set when both can be hashed.
+    """
+    if as_set is not None:
+        try:
+            return item in as_set
+        except TypeError:
+            pass
+    return item in items
+
+
+@functools.cache
+def _request_annotation(view_class: type) -> object | None:
+    """
+    Return the annotation for `request` on a view class.
+    """
+    return typing.get_type_hints(view_class).get("request")
+
+
 class PatternScenario(Generic[_view_patterns.T_Pattern], abc.ABC):  # noqa: UP046
     """
     Represents a check that is run on a specific pattern.
@@ -100,7 +131,7 @@ class CheckPositionalArgsAreCorrectFunctionScenario(
             argument is neither `Any` or the expected annotation for that argument.
         """
         incorrect: list[_errors.MismatchedRequiredArgs.Incorrect] = []
-        positional = list(function.positional)
+        positional = function.positional
 
         position = -1
         for arg in function.function_args:
@@ -108,8 +139,8 @@ class CheckPositionalArgsAreCorrectFunctionScenario(
                 continue
 
             position += 1
-            if positional:
-                name, annotation = positional.pop(0)
+            if position < len(positional):
+                name, annotation = positional[position]
                 if arg.is_variable_positional:
                     incorrect.append(_errors.MismatchedRequiredArgs.Incorrect.missing(name))
                     break
@@ -123,7 +154,7 @@ class CheckPositionalArgsAreCorrectFunctionScenario(
                             index=position, want=name, got=arg.name
                         )
                     )
-                elif arg.annotation not in (Any, annotation):
+                elif arg.annotation is not Any and arg.annotation != annotation:
                     result = self.is_mistyped(
                         name=name,
                         position=position,
@@ -151,7 +182,9 @@ class CheckPositionalArgsAreCorrectFunctionScenario(
         if incorrect:
             self.add_error(
                 errors=errors,
-                error=_errors.MismatchedRequiredArgs(function=function, incorrect=incorrect),
+                error=_errors.MismatchedRequiredArgs(
+                    function=function, incorrect=tuple(incorrect)
+                ),
             )
 
     def add_error(
@@ -204,30 +237,14 @@ class CheckRequiredArgsMatchUrlPatternFunctionScenario(
         Discover the arguments that must be passed into the function and complain
         about any that are missing from the pattern.
         """
-        missing: set[str] = set()
-
-        positional = list(function.positional)
-
-        for arg in function.function_args:
-            if arg.is_self:
-                continue
-
-            if positional:
-                positional.pop(0)
-                continue
-
-            if (
-                arg.required
-                and not any(arg.name in part.captured for part in pattern.parts)
-                and not any(arg.name in part.default_arg_names for part in pattern.parts)
-            ):
-                missing.add(arg.name)
+        # The required positional arguments are checked by a different scenario
+        missing = function.required_keyword_names - pattern.provided_names
 
         if missing:
             self.add_error(
                 errors=errors,
                 error=_errors.RequiredArgOnViewNotAlwaysRequiredByPattern(
-                    pattern_wheres=[part.where for part in pattern.parts],
+                    pattern_wheres=tuple(part.where for part in pattern.parts),
                     function_where=function.display,
                     missing_args=missing,
                 ),
@@ -271,34 +288,20 @@ class CheckAcceptsArgsFunctionScenario(FunctionScenario[_view_patterns.T_ViewPat
         if function.allows_arbitrary:
             return
 
-        available: set[str] = set()
+        available = function.keyword_names
         missing: list[tuple[_display.Where, str]] = []
 
-        positional = list(function.positional)
-        for arg in function.function_args:
-            if arg.is_self:
-                continue
-
-            if positional:
-                positional.pop(0)
-                continue
-
-            if arg.is_variable_keywords or arg.is_variable_positional:
-                continue
-
-            available.add(arg.name)
-
         for part in pattern.parts:
-            for name in (*part.captured, *part.default_arg_names):
-                if name not in available:
-                    missing.append((part.where, name))
+            missing.extend(
+                (part.where, name) for name in part.captured_and_defaults if name not in available
+            )
 
         if missing:
             self.add_error(
                 errors=errors,
                 error=_errors.ViewDoesNotAcceptCapturedArg(
                     where=pattern.where,
-                    missing=missing,
+                    missing=tuple(missing),
                     function_where=function.display,
                 ),
             )
@@ -324,6 +327,20 @@ class CheckViewClassRequestAnnotationScenario(PatternScenario[_view_patterns.T_V
 
     exit_early: bool = False
 
+    # Sets of the acceptable annotations for checking membership. The sequences
+    # are kept as they are given to the error class and are used instead when
+    # an annotation can't be hashed
+    _annotations: frozenset[object] | None = attrs.field(init=False, eq=False, repr=False)
+    _containers: frozenset[object] | None = attrs.field(init=False, eq=False, repr=False)
+
+    @_annotations.default
+    def _default_annotations(self) -> frozenset[object] | None:
+        return _frozenset_if_hashable(self.acceptable_annotations)
+
+    @_containers.default
+    def _default_containers(self) -> frozenset[object] | None:
+        return _frozenset_if_hashable(self.acceptable_request_annotation_containers)
+
     def run(
         self,
         *,
@@ -338,10 +355,11 @@ class CheckViewClassRequestAnnotationScenario(PatternScenario[_view_patterns.T_V
         Otherwise we defer to `annotation_is_valid` to determine if the annotation
         is correct.
         """
-        if pattern.view_class is None:
+        view_class: type | None = pattern.view_class
+        if view_class is None:
             return
 
-        request_annotation = typing.get_type_hints(pattern.view_class).get("request")
+        request_annotation = _request_annotation(view_class)
         if request_annotation is None:
             return
 
@@ -357,7 +375,7 @@ class CheckViewClassRequestAnnotationScenario(PatternScenario[_view_patterns.T_V
             self.add_error(
                 errors=errors,
                 error=self.error_class(
-                    view_class=pattern.view_class,
+                    view_class=view_class,
                     request_annotation=request_annotation,
                     where=pattern.where,
                     expected_user_type=auth_user_model,
@@ -388,17 +406,18 @@ class CheckViewClassRequestAnnotationScenario(PatternScenario[_view_patterns.T_V
 
         This can be subclass'd when a project has it's own specific rules.
         """
-        origin = typing.get_origin(annotation)
-        args = typing.get_args(annotation)
-
-        if annotation in self.acceptable_annotations:
+        if _is_one_of(annotation, self._annotations, self.acceptable_annotations):
             return True
 
-        return bool(
-            origin in self.acceptable_request_annotation_containers
-            and args
-            and args[0] == auth_user_model
-        )
+        if not _is_one_of(
+            typing.get_origin(annotation),
+            self._containers,
+            self.acceptable_request_annotation_containers,
+        ):
+            return False
+
+        args = typing.get_args(annotation)
+        return bool(args) and args[0] is auth_user_model
 
 
 @attrs.frozen
@@ -422,7 +441,7 @@ class CheckHasCorrectAnnotationsFunctionScenario(FunctionScenario[_view_patterns
         This matches the annotations on the function args to the annotations on
         the captured args on the pattern.
         """
-        args_by_name = {function_arg.name: function_arg for function_arg in function.function_args}
+        args_by_name = function.args_by_name
 
         incorrect: list[tuple[str, object, object]] = []
 
@@ -439,7 +458,7 @@ class CheckHasCorrectAnnotationsFunctionScenario(FunctionScenario[_view_patterns
                 error=_errors.InvalidArgAnnotations(
                     function_where=function.display,
                     where=pattern.where,
-                    incorrect=incorrect,
+                    incorrect=tuple(incorrect),
                 ),
             )
 
@@ -483,11 +502,12 @@ class CheckKwargsMustBeAnnotatedFunctionScenario(FunctionScenario[_view_patterns
             if not arg.is_variable_keywords:
                 continue
 
-            if self.allows_object and arg.annotation == object:
-                continue
+            # There can only be one `**kwargs` so there is nothing left to look at
+            if self.allows_object and arg.annotation is object:
+                break
 
-            if self.allows_any and arg.annotation == Any:
-                continue
+            if self.allows_any and arg.annotation is Any:
+                break
 
             self.add_error(
                 errors=errors,
@@ -498,6 +518,7 @@ class CheckKwargsMustBeAnnotatedFunctionScenario(FunctionScenario[_view_patterns
                     allows_any=self.allows_any,
                 ),
             )
+            break
 
     def add_error(
         self, *, errors: _errors.ErrorContainer, error: _errors.KwargsMustBeAnnotated
@@ -5,7 +5,7 @@ from typing import Generic, Protocol, Self
 
 import attrs
 
-from . import _errors, _raw_patterns, _scenarios, _view_patterns
+from . import _errors, _functions, _raw_patterns, _scenarios, _view_patterns
 
 
 class PatternMaker(Protocol[_view_patterns.T_CO_Pattern]):
@@ -63,10 +63,10 @@ class TestRunner(Generic[_view_patterns.T_Pattern]):  # noqa: UP046
             else:
                 patterns.append(pattern)
 
-        if any(errors):
+        if errors:
             raise _errors.FoundInvalidPatterns(errors=errors)
 
-        return cls(patterns=patterns)
+        return cls(patterns=tuple(patterns))
 
     def run_scenarios(
         self,
@@ -92,29 +92,44 @@ class TestRunner(Generic[_view_patterns.T_Pattern]):  # noqa: UP046
         """
         errors = _errors.ErrorContainer()
 
-        for pattern_scenario in pattern_scenarios:
-            for pattern in self._patterns:
-                if pattern.exclude(auth_user_model=auth_user_model):
-                    continue
+        # Exclusion only depends on the pattern so it's worked out once for all scenarios
+        patterns = [
+            pattern
+            for pattern in self._patterns
+            if not pattern.exclude(auth_user_model=auth_user_model)
+        ]
+
+        if not patterns:
+            # Scenarios have nothing to complain about without patterns
+            return
 
+        for pattern_scenario in pattern_scenarios:
+            for pattern in patterns:
                 pattern_scenario.run(
                     errors=errors, pattern=pattern, auth_user_model=auth_user_model
                 )
 
-            if pattern_scenario.exit_early and any(errors):
+            if pattern_scenario.exit_early and errors:
                 raise _errors.FoundInvalidPatterns(errors=errors)
 
-        for function_scenario in function_scenarios:
-            for pattern in self._patterns:
-                if pattern.exclude(auth_user_model=auth_user_model):
-                    continue
-
-                for function in pattern.relevant_functions():
-                    if pattern.exclude_function(
+        # As are the functions on each pattern that should be analysed
+        functions_by_pattern: list[
+            tuple[_view_patterns.T_Pattern, list[_functions.DispatchFunction]]
+        ] = []
+        if function_scenarios:
+            for pattern in patterns:
+                functions = [
+                    function
+                    for function in pattern.relevant_functions()
+                    if not pattern.exclude_function(
                         auth_user_model=auth_user_model, function=function
-                    ):
-                        continue
+                    )
+                ]
+                functions_by_pattern.append((pattern, functions))
 
+        for function_scenario in function_scenarios:
+            for pattern, functions in functions_by_pattern:
+                for function in functions:
                     function_scenario.run(
                         errors=errors,
                         pattern=pattern,
@@ -122,8 +137,8 @@ class TestRunner(Generic[_view_patterns.T_Pattern]):  # noqa: UP046
                         function=function,
                     )
 
-            if function_scenario.exit_early and any(errors):
+            if function_scenario.exit_early and errors:
                 raise _errors.FoundInvalidPatterns(errors=errors)
 
-        if any(errors):
+        if errors:
             raise _errors.FoundInvalidPatterns(errors=errors)
@@ -21,6 +21,8 @@ T_ViewPattern = TypeVar("T_ViewPattern", bound="ViewPattern", default="ViewPatte
 
 T_CO_Pattern = TypeVar("T_CO_Pattern", bound="Pattern", default="Pattern", covariant=True)
 
+_DJANGO_DIR = str(pathlib.Path(django.__file__).parent)
+
 
 def ensure_raw_pattern_is_generic_view(
     *, raw_pattern: _raw_patterns.RawPattern
@@ -39,8 +41,9 @@ def ensure_raw_pattern_is_generic_view(
     And so it will also complain if there are no named capture groups if the pattern has any
     captured groups
     """
-    if raw_pattern.view_class is not None:
-        if not issubclass(raw_pattern.view_class, generic.View):
+    view_class = raw_pattern.view_class
+    if view_class is not None:
+        if not issubclass(view_class, generic.View):
             raise _errors.MustSubclassDjangoGenericView(
                 pattern=raw_pattern, where=raw_pattern.where
             )
@@ -53,10 +56,10 @@ def ensure_raw_pattern_is_generic_view(
     # So as long as there are more than zero captured groups if we have any group, then the
     # view will only get keyword arguments
     for part in raw_pattern.parts:
-        if part.groups and len(part.captured) == 0:
+        if part.groups and not part.captured:
             raise _errors.NoPositionalArguments(pattern=raw_pattern, where=part.where)
 
-    return raw_pattern.view_class
+    return view_class
 
 
 class Pattern(abc.ABC):
@@ -128,6 +131,13 @@ class ViewPattern(Generic[T_ViewClass], Pattern):  # noqa: UP046
     where: _display.Where
     """Information of where the final part of this pattern was defined"""
 
+    provided_names: frozenset[str] = attrs.field(init=False, eq=False, repr=False)
+    """The names of every captured and default arg the parts of this pattern provide"""
+
+    @provided_names.default
+    def _default_provided_names(self) -> frozenset[str]:
+        return frozenset(name for part in self.parts for name in part.captured_and_defaults)
+
     def exclude(self, *, auth_user_model: type) -> bool:
         """
         By default no pattern is excluded.
@@ -144,9 +154,7 @@ class ViewPattern(Generic[T_ViewClass], Pattern):  # noqa: UP046
             # Ignore code that comes from django itself
             # Nothing to be gained from complaining about code that is out of the user's control
             return True
-        elif function.view_class is None and function.module.startswith(
-            str(pathlib.Path(django.__file__).parent)
-        ):
+        elif function.view_class is None and function.module.startswith(_DJANGO_DIR):
             # Ignore code that comes from django itself
             # Nothing to be gained from complaining about code that is out of the user's control
             return True
@@ -223,19 +231,16 @@ class ViewPattern(Generic[T_ViewClass], Pattern):  # noqa: UP046
 
         As well as `http_method_not_allowed` method.
         """
+        positional = (("request", request_type),)
         yield self.make_dispatch_function(
-            view_class.http_method_not_allowed,
-            positional=(("request", request_type),),
+            view_class.http_method_not_allowed, positional=positional
         )
 
         for method_name in view_class.http_method_names:
             method = getattr(view_class, method_name, None)
 
             if method is not None:
-                yield self.make_dispatch_function(
-                    method,
-                    positional=(("request", request_type),),
-                )
+                yield self.make_dispatch_function(method, positional=positional)
 
     def display_view_class(self, *, indent: str = "  ") -> str:
         """
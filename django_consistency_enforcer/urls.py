@@ -1,3 +1,4 @@
+from ._caches import clear_caches
 from ._display import Where
 from ._functions import DispatchFunction, Function, FunctionArg
 from ._raw_patterns import (
@@ -43,5 +44,6 @@ __all__ = [
     "ViewPattern",
     "Where",
     "all_django_patterns",
+    "clear_caches",
     "ensure_raw_pattern_is_generic_view",
 ]
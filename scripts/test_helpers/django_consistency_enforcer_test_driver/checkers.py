@@ -17,10 +17,9 @@ def expect_zero_or_one_errors() -> Iterator[enforcer_errors.ErrorContainer]:
     try:
         yield errors
     finally:
-        found = list(errors)
-        if found:
-            assert len(found) == 1
-            raise found[0]
+        if errors:
+            assert len(errors) == 1
+            raise next(iter(errors))
 
 
 def expect_invalid_django_pattern_error(
@@ -3,6 +3,8 @@ from django.urls import converters
 
 from django_consistency_enforcer import urls as enforcer
 
+_NOT_COMPARED = object()
+
 
 @attrs.mutable
 class IsConverter:
@@ -11,17 +13,17 @@ class IsConverter:
     """
 
     expect: type
-    got: object = attrs.field(init=False)
+    got: object = attrs.field(init=False, default=_NOT_COMPARED)
 
     def __eq__(self, o: object) -> bool:
         self.got = o
         return isinstance(o, self.expect)
 
     def __repr__(self) -> str:
-        if hasattr(self, "got"):
-            return repr(self.got)
-        else:
+        if self.got is _NOT_COMPARED:
             return super().__repr__()
+        else:
+            return repr(self.got)
 
 
 def CapturedInt() -> enforcer.CapturedArg:
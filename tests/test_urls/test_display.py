@@ -28,3 +28,17 @@ def test_can_display_for_a_class_view_function() -> None:
     method = get
     """).strip()
     )
+
+
+def test_empty_where_is_shared() -> None:
+    where = enforcer.Where.empty()
+    assert where == enforcer.Where(name="", regex="", module="", namespace="")
+    assert enforcer.Where.empty() is where
+
+
+def test_where_display_is_remembered_per_options() -> None:
+    where = enforcer.Where(name="a", regex="^b", module="c.py", namespace="")
+    displayed = where.display()
+    assert displayed == "  module = c.py\n  name = a\n  regex = ^b"
+    assert where.display() is displayed
+    assert where.display(indent="", display_regex=False) == "module = c.py\nname = a"
@@ -55,3 +55,73 @@ class TestErrorContainer:
         assert list(errors) == [e1, e4, e5]
         assert list(errors.errors) == [e1, e4, e5]
         assert list(errors.by_most_repeated) == [str(e4), str(e1), str(e5)]
+
+    def test_it_only_builds_the_str_of_an_error_once(self) -> None:
+        built: list[str] = []
+
+        @attrs.frozen
+        class ErrorOne(enforcer_errors.InvalidPattern):
+            value: str
+
+            def build_str(self) -> str:
+                built.append(self.value)
+                return self.value
+
+        errors = enforcer_errors.ErrorContainer()
+        e1 = ErrorOne("one")
+        errors.add(e1)
+        errors.add(e1)
+        assert str(e1) == "one"
+        assert built == ["one"]
+
+        e2 = ErrorOne("one")
+        errors.add(e2)
+        assert str(e2) == "one"
+        assert built == ["one", "one"]
+        assert list(errors) == [e1]
+
+    def test_it_counts_the_same_error_instance_each_time_it_is_added(self) -> None:
+        class ErrorOne(enforcer_errors.InvalidPattern):
+            def build_str(self) -> str:
+                return "one"
+
+        class ErrorTwo(enforcer_errors.InvalidPattern):
+            def build_str(self) -> str:
+                return "two"
+
+        errors = enforcer_errors.ErrorContainer()
+        e1 = ErrorOne()
+        e2 = ErrorTwo()
+        errors.add(e1)
+        errors.add(e2)
+        errors.add(e2)
+        assert list(errors) == [e1, e2]
+        assert list(errors.by_most_repeated) == ["two", "one"]
+
+    def test_it_knows_how_many_distinct_errors_it_has(self) -> None:
+        class ErrorOne(enforcer_errors.InvalidPattern):
+            def build_str(self) -> str:
+                return "one"
+
+        errors = enforcer_errors.ErrorContainer()
+        assert not errors
+        assert len(errors) == 0
+
+        errors.add(ErrorOne())
+        errors.add(ErrorOne())
+        assert errors
+        assert len(errors) == 1
+
+
+class TestMismatchedRequiredArgsIncorrect:
+    def test_it_can_explain_a_misnamed_argument(self) -> None:
+        Incorrect = enforcer_errors.MismatchedRequiredArgs.Incorrect
+        assert Incorrect.misnamed(index=0, got="a", want="b") == Incorrect(
+            reason="The first argument should be named b, but got a"
+        )
+        assert Incorrect.misnamed(index=1, got="a", want="b") == Incorrect(
+            reason="The second argument should be named b, but got a"
+        )
+        assert Incorrect.misnamed(index=2, got="a", want="b") == Incorrect(
+            reason="Require positional parameter 2 to be named b, but got a"
+        )
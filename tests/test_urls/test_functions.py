@@ -533,3 +533,111 @@ class TestSignaturesForClassView:
             ("head", test_helpers.views.generic_view_positional),
             ("options", test_helpers.views.generic_view_positional),
         ]
+
+
+class TestFunctionFromCallback:
+    def test_it_remembers_the_function_for_a_callback_and_view_class(self) -> None:
+        function = enforcer.Function.from_callback(test_helpers.views.my_view)
+        assert enforcer.Function.from_callback(test_helpers.views.my_view) is function
+
+        method = enforcer.Function.from_callback(
+            test_helpers.views.MyViewChild.get, view_class=test_helpers.views.MyViewChild
+        )
+        assert (
+            enforcer.Function.from_callback(
+                test_helpers.views.MyViewChild.get, view_class=test_helpers.views.MyViewChild
+            )
+            is method
+        )
+        assert (
+            enforcer.Function.from_callback(
+                test_helpers.views.MyViewChild.get, view_class=test_helpers.views.MyViewParent
+            )
+            is not method
+        )
+
+    def test_it_forgets_functions_when_caches_are_cleared(self) -> None:
+        function = enforcer.Function.from_callback(test_helpers.views.my_view)
+        enforcer.clear_caches()
+        assert enforcer.Function.from_callback(test_helpers.views.my_view) is not function
+
+    def test_it_understands_functions_without_annotations(self) -> None:
+        def my_view(request, *, one, two=2):  # type: ignore[no-untyped-def]
+            pass
+
+        assert enforcer.Function.from_callback(my_view) == enforcer.Function(
+            name="my_view",
+            module=__file__,
+            function_args=[
+                enforcer.FunctionArg(
+                    name="request", keyword_only=False, required=True, annotation=Any
+                ),
+                enforcer.FunctionArg(name="one", keyword_only=True, required=True, annotation=Any),
+                enforcer.FunctionArg(
+                    name="two", keyword_only=True, required=False, annotation=Any
+                ),
+            ],
+            allows_arbitrary=False,
+        )
+
+    def test_it_can_find_function_args_by_name(self) -> None:
+        def my_view(request: http.HttpRequest, *, one: int, two: str = "") -> None:
+            pass
+
+        function = enforcer.Function.from_callback(my_view)
+        assert isinstance(function.function_args, tuple)
+        assert function.args_by_name == {arg.name: arg for arg in function.function_args}
+        assert list(function.args_by_name) == ["request", "one", "two"]
+
+    def test_it_knows_which_args_can_be_passed_by_keyword(self) -> None:
+        def my_view(
+            request: http.HttpRequest, *args: object, one: int, two: str = "", **kwargs: int
+        ) -> None:
+            pass
+
+        function = enforcer.Function.from_callback(my_view)
+        assert function.keyword_names(skip_positional=1) == frozenset({"one", "two"})
+        assert function.keyword_names(skip_positional=0) == frozenset({"request", "one", "two"})
+        assert function.required_keyword_names(skip_positional=1) == frozenset({"one"})
+        assert function.required_keyword_names(skip_positional=0) == frozenset({"request", "one"})
+        assert function.keyword_names(skip_positional=1) is function.keyword_names(
+            skip_positional=1
+        )
+
+        dispatch_function = enforcer.DispatchFunction.from_callback(
+            my_view, positional=(("request", http.HttpRequest),)
+        )
+        assert dispatch_function.keyword_names == frozenset({"one", "two"})
+        assert dispatch_function.keyword_names is dispatch_function.keyword_names
+        assert dispatch_function.required_keyword_names == frozenset({"one"})
+
+
+class TestFunctionArgMatches:
+    def make_arg(
+        self, annotation: object, *, is_variable_keywords: bool = False
+    ) -> enforcer.FunctionArg:
+        return enforcer.FunctionArg(
+            name="arg",
+            required=True,
+            keyword_only=True,
+            annotation=annotation,
+            is_variable_keywords=is_variable_keywords,
+        )
+
+    def test_it_matches_anything_when_annotated_with_any(self) -> None:
+        assert self.make_arg(Any).matches(int)
+        assert self.make_arg(Any).matches(int | str)
+
+    def test_it_matches_anything_for_kwargs_annotated_with_object(self) -> None:
+        assert self.make_arg(object, is_variable_keywords=True).matches(int)
+        assert not self.make_arg(object).matches(int)
+
+    def test_it_matches_the_same_annotation(self) -> None:
+        assert self.make_arg(int).matches(int)
+        assert not self.make_arg(int).matches(str)
+
+    def test_it_understands_unions(self) -> None:
+        assert self.make_arg(int | str).matches(int)
+        assert self.make_arg(int | str).matches(str | int)
+        assert not self.make_arg(int).matches(int | str)
+        assert not self.make_arg(int | str).matches(int | bool)
@@ -1,9 +1,11 @@
 import types
+import uuid
 
 import django_consistency_enforcer_test_driver as test_helpers
+import pytest
 from django import http
 from django import urls as django_urls
-from django.urls import resolvers
+from django.urls import converters, resolvers
 from django.views import generic
 
 from django_consistency_enforcer import urls as enforcer
@@ -129,3 +131,57 @@ def test_all_django_patterns() -> None:
     # Prove default_args works the way we think it does
     cb, ags, kws = tuple(root_patterns.resolve("/five"))
     assert cb(http.HttpRequest(), *ags, **kws).content == b"greeting"
+
+
+class TestRawPatternPart:
+    def test_it_knows_the_names_it_provides(self) -> None:
+        part = enforcer.RawPatternPart(
+            groups=1,
+            captured={"branch": enforcer.CapturedArg(converter=None, annotation=str)},
+            default_arg_names={"greeting"},
+            where=enforcer.Where.empty(),
+        )
+        assert part.captured_and_defaults == ("branch", "greeting")
+
+
+class TestCapturedArgFromConverter:
+    def test_it_knows_the_builtin_converters(self) -> None:
+        for converter, annotation in (
+            (None, str),
+            (converters.StringConverter(), str),
+            (converters.SlugConverter(), str),
+            (converters.PathConverter(), str),
+            (converters.IntConverter(), int),
+            (converters.UUIDConverter(), uuid.UUID),
+        ):
+            captured = enforcer.CapturedArg.from_converter(converter)  # type: ignore[arg-type]
+            assert captured == enforcer.CapturedArg(converter=converter, annotation=annotation)  # type: ignore[arg-type]
+
+    def test_it_knows_subclasses_of_builtin_converters(self) -> None:
+        class MyIntConverter(converters.IntConverter):
+            regex = "[0-9]{4}"
+
+        converter = MyIntConverter()
+        captured = enforcer.CapturedArg.from_converter(converter)  # type: ignore[arg-type]
+        assert captured == enforcer.CapturedArg(converter=converter, annotation=int)  # type: ignore[arg-type]
+
+    def test_it_uses_the_return_annotation_of_to_python_for_other_converters(self) -> None:
+        class MyConverter:
+            regex = "[0-9]+"
+
+            def to_python(self, value: str) -> float:
+                return float(value)
+
+            def to_url(self, value: float) -> str:
+                return str(value)
+
+        converter = MyConverter()
+        captured = enforcer.CapturedArg.from_converter(converter)  # type: ignore[arg-type]
+        assert captured == enforcer.CapturedArg(converter=converter, annotation=float)  # type: ignore[arg-type]
+
+    def test_it_complains_about_converters_it_does_not_understand(self) -> None:
+        class MyConverter:
+            regex = "[0-9]+"
+
+        with pytest.raises(AssertionError, match="Need to expand the test"):
+            enforcer.CapturedArg.from_converter(MyConverter())  # type: ignore[arg-type]
@@ -746,3 +746,62 @@ def test_it_can_exclude_patterns_and_functions() -> None:
         # (scenario3, p3, f8),
         (scenario3, p3, f9),
     ]
+
+
+def test_it_only_works_out_exclusions_once_per_run() -> None:
+    def c1() -> None:
+        pass
+
+    def c2() -> None:
+        pass
+
+    f1 = enforcer.DispatchFunction.from_callback(c1, positional=())
+    f2 = enforcer.DispatchFunction.from_callback(c2, positional=())
+
+    asked: list[object] = []
+
+    @attrs.frozen
+    class _StubPattern(test_helpers.scenarios.StubPattern):
+        name: str = "p1"
+        _dispatch_functions: Sequence[enforcer.DispatchFunction] = (f1, f2)
+
+        def exclude(self, *, auth_user_model: type) -> bool:
+            asked.append(("exclude", self))
+            return False
+
+        def exclude_function(
+            self, *, auth_user_model: type, function: enforcer.DispatchFunction
+        ) -> bool:
+            asked.append(("exclude_function", self, function))
+            return function == f2
+
+    p1 = _StubPattern()
+
+    test_runner: enforcer.TestRunner[test_helpers.scenarios.StubPattern] = enforcer.TestRunner(
+        patterns=(p1,)
+    )
+
+    called: list[object] = []
+
+    scenario1 = test_helpers.scenarios.StubPatternScenario(name="s1", on_run=called.append)
+    scenario2 = test_helpers.scenarios.StubPatternScenario(name="s2", on_run=called.append)
+    scenario3 = test_helpers.scenarios.StubFunctionScenario(name="s3", on_run=called.append)
+    scenario4 = test_helpers.scenarios.StubFunctionScenario(name="s4", on_run=called.append)
+
+    test_runner.run_scenarios(
+        auth_user_model=object,
+        pattern_scenarios=(scenario1, scenario2),
+        function_scenarios=(scenario3, scenario4),
+    )
+
+    assert called == [
+        (scenario1, p1),
+        (scenario2, p1),
+        (scenario3, p1, f1),
+        (scenario4, p1, f1),
+    ]
+    assert asked == [
+        ("exclude", p1),
+        ("exclude_function", p1, f1),
+        ("exclude_function", p1, f2),
+    ]
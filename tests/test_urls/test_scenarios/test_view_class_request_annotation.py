@@ -1,4 +1,6 @@
+import typing
 from collections.abc import Iterator, Sequence
+from typing import Annotated
 
 import django_consistency_enforcer_test_driver as test_helpers
 import pytest
@@ -72,6 +74,99 @@ class TestViewRequestAnnotation:
 
         self.runCheck(MyView2, user_type=int, acceptable=(bool,), acceptable_containers=())
 
+    def test_it_reuses_the_request_annotation_for_the_same_view_class(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class MyView(generic.View):
+            request: http.HttpRequest
+
+        get_type_hints = typing.get_type_hints
+        looked_at: list[object] = []
+
+        def counting_get_type_hints(obj: object, *args: object, **kwargs: object) -> object:
+            if obj is MyView:
+                looked_at.append(obj)
+            return get_type_hints(obj, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(typing, "get_type_hints", counting_get_type_hints)
+
+        def check() -> None:
+            self.runCheck(
+                MyView, user_type=int, acceptable=(http.HttpRequest,), acceptable_containers=()
+            )
+
+        check()
+        check()
+        assert looked_at == [MyView]
+
+        enforcer.clear_caches()
+        check()
+        assert looked_at == [MyView, MyView]
+
+    def test_is_happy_with_annotated_request_annotations(self) -> None:
+        class MyView(generic.View):
+            request: Annotated[http.HttpRequest, {"meta": 1}]
+
+        self.runCheck(
+            MyView, user_type=int, acceptable=(http.HttpRequest,), acceptable_containers=()
+        )
+        self.runCheck(
+            MyView,
+            user_type=int,
+            acceptable=(Annotated[http.HttpRequest, {"meta": 1}], http.HttpRequest),
+            acceptable_containers=(),
+        )
+
+    def test_can_check_annotations_that_cannot_be_hashed(self) -> None:
+        class _Authenticated[T_User]:
+            user: T_User
+
+        class MyView(generic.View):
+            pass
+
+        class StubInvalidRequestAnnotation(enforcer_errors.InvalidRequestAnnotation):
+            @property
+            def expect(self) -> str:
+                return ""
+
+            @property
+            def expanded_note(self) -> Iterator[str]:
+                yield ""
+
+        unhashable = Annotated[http.HttpRequest, {"meta": 1}]
+        pattern = test_helpers.patterns.from_raw_pattern(
+            enforcer.RawPattern.from_parts(
+                [], where=enforcer.Where.empty(), callback=MyView.as_view()
+            )
+        )
+
+        def is_valid(
+            annotation: object,
+            *,
+            acceptable: Sequence[object],
+            acceptable_containers: Sequence[object] = (),
+        ) -> bool:
+            scenario = enforcer.CheckViewClassRequestAnnotationScenario(
+                error_class=StubInvalidRequestAnnotation,
+                acceptable_annotations=acceptable,
+                acceptable_request_annotation_containers=acceptable_containers,
+            )
+            with test_helpers.checkers.expect_zero_or_one_errors() as errors:
+                return scenario.annotation_is_valid(
+                    errors=errors,
+                    auth_user_model=int,
+                    annotation=annotation,
+                    pattern=pattern,
+                )
+
+        assert not is_valid(unhashable, acceptable=(http.HttpRequest,))
+        assert is_valid(unhashable, acceptable=(http.HttpRequest, unhashable))
+        assert is_valid(http.HttpRequest, acceptable=(unhashable, http.HttpRequest))
+        assert not is_valid(int, acceptable=(unhashable,))
+        assert is_valid(
+            _Authenticated[int], acceptable=(unhashable,), acceptable_containers=(_Authenticated,)
+        )
+
     def test_is_unhappy_with_not_acceptable_types(self) -> None:
         class MyView(generic.View):
             request: int  # type: ignore[assignment]
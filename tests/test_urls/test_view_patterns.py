@@ -1,6 +1,7 @@
 import django_consistency_enforcer_test_driver as test_helpers
 import pytest
 from django import http
+from django.views import generic
 
 from django_consistency_enforcer import errors as enforcer_errors
 from django_consistency_enforcer import urls as enforcer
@@ -67,3 +68,50 @@ class TestViewPattern:
               :: Please ensure that captured groups in url patterns always have a name
             """,
         )
+
+    def test_it_knows_the_names_provided_by_its_parts(self) -> None:
+        where = enforcer.Where.empty()
+        pattern = test_helpers.patterns.from_raw_pattern(
+            enforcer.RawPattern.from_parts(
+                [
+                    enforcer.RawPatternPart(
+                        groups=1,
+                        captured={"one": enforcer.CapturedArg(converter=None, annotation=str)},
+                        where=where,
+                    ),
+                    enforcer.RawPatternPart(
+                        groups=0, captured={}, default_arg_names={"two"}, where=where
+                    ),
+                ],
+                where=where,
+                callback=test_helpers.views.my_view,
+            )
+        )
+        assert pattern.provided_names == frozenset({"one", "two"})
+
+    def test_it_finds_http_methods_added_after_the_view_class_was_seen(self) -> None:
+        class MyView(generic.View):
+            def get(self, request: http.HttpRequest) -> http.HttpResponse:
+                return http.HttpResponse("hi")
+
+        def make_pattern() -> enforcer.ViewPattern:
+            return test_helpers.patterns.from_raw_pattern(
+                enforcer.RawPattern.from_parts(
+                    [], where=enforcer.Where.empty(), callback=MyView.as_view()
+                )
+            )
+
+        def method_names() -> list[str]:
+            return [
+                function.name
+                for function in make_pattern().relevant_functions()
+                if function.defined_on is MyView
+            ]
+
+        assert method_names() == ["get"]
+
+        def post(self: MyView, request: http.HttpRequest) -> http.HttpResponse:
+            return http.HttpResponse("hi")
+
+        MyView.post = post  # type: ignore[attr-defined]
+        assert method_names() == ["get", "post"]